@@ -17,7 +17,7 @@ from capellambse import decl
 
 from capella_rm_bridge import changeset
 
-from . import auditing
+from . import auditing, load
 
 CHANGE_FOLDER_PATH = pathlib.Path("change-sets")
 CHANGE_FILENAME = "change-set.yaml"
@@ -145,14 +145,14 @@ def main(
     else:
         logging.basicConfig(level=logging.WARNING)
 
-    config = yaml.safe_load(conffile)
+    config = yaml.load(conffile, Loader=load.SafeLoader)
     params = config["model"]
     if pull is not None:
         params["update_cache"] = pull
 
     model = capellambse.MelodyModel(**params)
 
-    snapshot = yaml.safe_load(snapshotfile)
+    snapshot = yaml.load(snapshotfile, Loader=load.SafeLoader)
     reporter = auditing.RMReporter(model)
     for module, tconfig in zip(snapshot["modules"], config["live-docs"]):
         change_set, errors = changeset.calculate_change_set(
@@ -7,6 +7,7 @@ from __future__ import annotations
 import collections.abc as cabc
 import datetime
 import logging
+import sys
 import typing as t
 
 import capellambse
@@ -22,6 +23,12 @@ TYPES_FOLDER_IDENTIFIER = "-2"
 
 REQ_TYPE_NAME = "Requirement"
 _ATTR_BLACKLIST = frozenset({("Type", "Folder")})
+_ATTR_BLACKLIST_NAMES = frozenset(name for name, _ in _ATTR_BLACKLIST)
+_REQ_FILTER = frozenset({"id", "type", "attributes", "children"})
+_REQTYPE_FILTER = frozenset({"attributes"})
+_VALUE_CONVERSIONS: cabc.Mapping[str, cabc.Callable[[t.Any], t.Any]] = {
+    "text": helpers.repair_html
+}
 _ATTR_VALUE_DEFAULT_MAP: cabc.Mapping[str, type] = {
     "Boolean": bool,
     "Date": datetime.datetime,
@@ -31,21 +38,64 @@ _ATTR_VALUE_DEFAULT_MAP: cabc.Mapping[str, type] = {
     "Integer": int,
     "String": str,
 }
+_UUIDRef = decl.UUIDReference
+_Promise = decl.Promise
 
 
 WorkItem = t.Union[reqif.Requirement, reqif.Folder]
 RMIdentifier = t.NewType("RMIdentifier", str)
+AttributeValue = reqif.AbstractRequirementsAttribute
 AttributeDefinitionClass = t.Union[
     type[reqif.AttributeDefinition], type[reqif.AttributeDefinitionEnumeration]
 ]
 
 
+class _AttributeSchema(t.NamedTuple):
+    deftype: str
+    expected_type: type | None
+    key: str
+
+
+class _ModelAttribute(t.NamedTuple):
+    attribute: AttributeValue
+    definition_id: str | None
+    value: t.Any
+
+
 class _AttributeValueBuilder(t.NamedTuple):
     deftype: str
     key: str
     value: act.Primitive | RMIdentifier | None
 
 
+_WorkItemContainers = tuple[
+    list[t.Union[dict[str, t.Any], decl.UUIDReference]],
+    list[t.Union[dict[str, t.Any], decl.UUIDReference]],
+]
+
+
+class _ChildFrame(t.NamedTuple):
+    item: act.WorkItem
+    parent: WorkItem | decl.Promise
+    containers: _WorkItemContainers
+
+
+class _CreateFrame(t.NamedTuple):
+    base: dict[str, t.Any]
+
+
+class _FolderFrame(t.NamedTuple):
+    base: dict[str, t.Any]
+    req: reqif.Folder
+    action_index: int
+    containers: _WorkItemContainers
+    child_req_ids: set[RMIdentifier]
+    child_folder_ids: set[RMIdentifier]
+
+
+_WorkItemFrame = t.Union[_ChildFrame, _CreateFrame, _FolderFrame]
+
+
 class MissingCapellaModule(Exception):
     """A ``CapellaModule`` with matching UUID could not be found."""
 
@@ -53,10 +103,44 @@ class MissingCapellaModule(Exception):
 class TrackerChange:
     """Unites the calculators for finding actions to sync requirements."""
 
+    __slots__ = (
+        "_location_changed",
+        "_module_children",
+        "_work_item_index",
+        "_reqtype_index",
+        "_enum_dtdef_index",
+        "_attr_schema",
+        "_reqtype_attr_names",
+        "_enum_options",
+        "_module_ref",
+        "_reqt_folder_ref",
+        "_req_deletions",
+        "_evdeletions",
+        "_faulty_attribute_definitions",
+        "errors",
+        "tracker",
+        "model",
+        "config",
+        "gather_logs",
+        "req_module",
+        "reqt_folder",
+        "actions",
+        "data_type_definitions",
+        "requirement_types",
+    )
+
     _location_changed: set[RMIdentifier]
+    _module_children: dict[str, list[WorkItem]]
+    _work_item_index: dict[str, dict[str, reqif.ReqIFElement | None]]
+    _reqtype_index: dict[str, reqif.ReqIFElement | None]
+    _enum_dtdef_index: dict[str, reqif.ReqIFElement | None]
+    _attr_schema: dict[RMIdentifier, dict[str, _AttributeSchema]]
+    _reqtype_attr_names: dict[RMIdentifier, frozenset[str]]
+    _enum_options: dict[str, frozenset[str]]
+    _module_ref: decl.UUIDReference
+    _reqt_folder_ref: decl.UUIDReference | None
     _req_deletions: dict[helpers.UUIDString, dict[str, t.Any]]
     _evdeletions: set[RMIdentifier]
-    _reqtype_ids: set[RMIdentifier]
     _faulty_attribute_definitions: set[str]
     errors: list[str]
 
@@ -73,8 +157,6 @@ class TrackerChange:
     """The corresponding ``reqif.CapellaModule`` for the tracker."""
     reqt_folder: reqif.CapellaTypesFolder | None
     """The `reqif.CapellaTypesFolder` storing fields data."""
-    reqtype_fields_filter: cabc.Mapping[RMIdentifier, set[str]]
-    """A mapping for whitelisted fieldnames per RequirementType."""
     actions: list[dict[str, t.Any]]
     """List of action requests for the tracker sync."""
     data_type_definitions: cabc.Mapping[str, act.DataType]
@@ -111,11 +193,6 @@ class TrackerChange:
         MissingCapellaModule
             If the model is missing a ``CapellaModule`` from the UUID
             declared in the ``config``.
-        InvalidWorkItemType
-            May be raised during
-            :meth:`TrackerChange.calculate_change` if an unknown ID of a
-            RequirementType is used (i.e. the integrity of the
-            ``requirement_types`` section in the snapshot is broken).
         InvalidFieldValue
             May be raised during
             :meth:`TrackerChange.calculate_change` if it is tried to
@@ -125,16 +202,26 @@ class TrackerChange:
         self.tracker = tracker
         self.data_type_definitions = self.tracker.get("data_types", {})
         self.requirement_types = self.tracker.get("requirement_types", {})
+        self._attr_schema = _build_attribute_schema(self.requirement_types)
+        self._reqtype_attr_names = {
+            RMIdentifier(_intern(id)): frozenset(reqtype.get("attributes", {}))
+            for id, reqtype in self.requirement_types.items()
+            if reqtype
+        }
+        self._enum_options = {
+            id: frozenset(value["id"] for value in ddef["values"])
+            for id, ddef in self.data_type_definitions.items()
+        }
 
         self.model = model
         self.config = config
         self.gather_logs = gather_logs
         self.actions = []
 
-        self._location_changed = set[RMIdentifier]()
+        self._location_changed = set()
         self._req_deletions = {}
-        self._evdeletions = set[RMIdentifier]()
-        self._faulty_attribute_definitions = set[str]()
+        self._evdeletions = set()
+        self._faulty_attribute_definitions = set()
         self.errors = []
 
         self.calculate_change()
@@ -150,55 +237,69 @@ class TrackerChange:
         deletions.
         """
         base = self.check_requirements_module()
+        self._module_children = {
+            "requirements": list(self.req_module.requirements),
+            "folders": list(self.req_module.folders),
+        }
         self.reqt_folder = find.find_by_identifier(  # type: ignore [assignment]
             self.model,
             TYPES_FOLDER_IDENTIFIER,
             reqif.CapellaTypesFolder.__name__,
             below=self.req_module,
         )
+        self._build_indexes()
         if self.reqt_folder is None:
+            self._reqt_folder_ref = None
             base = self.requirement_types_folder_create_action(base)
         else:
             assert isinstance(self.reqt_folder, reqif.CapellaTypesFolder)
+            self._reqt_folder_ref = _UUIDRef(self.reqt_folder.uuid)
             reqt_folder_action = self.data_type_definition_mod_actions()
             if reqtype_deletions := self.requirement_type_delete_actions():
-                dels = {"delete": {"requirement_types": reqtype_deletions}}
-                _deep_update(reqt_folder_action, dels)
+                type_deletions = reqt_folder_action.setdefault("delete", {})
+                type_deletions["requirement_types"] = reqtype_deletions
 
-            reqtype_creations = list[dict[str, t.Any]]()
-            for id, reqtype in self.requirement_types.items():
-                id = RMIdentifier(id)
-                if new_rtype := self.requirement_type_mod_action(id, reqtype):
+            reqtype_creations: list[dict[str, t.Any]] = []
+            for reqtype_id, reqtype in self.requirement_types.items():
+                new_rtype = self.requirement_type_mod_action(
+                    RMIdentifier(reqtype_id), reqtype
+                )
+                if new_rtype:
                     reqtype_creations.append(new_rtype)
 
             if reqtype_creations:
-                exts = {"extend": {"requirement_types": reqtype_creations}}
-                _deep_update(reqt_folder_action, exts)
+                extensions = reqt_folder_action.setdefault("extend", {})
+                extensions["requirement_types"] = reqtype_creations
 
-            if set(reqt_folder_action) != {"parent"}:
+            if len(reqt_folder_action) > 1:
                 self.actions.append(reqt_folder_action)
 
-        visited = set[str]()
+        visited: set[str] = set()
+        item_actions: list[dict[str, t.Any] | None] = []
+        req_extensions: list[dict[str, t.Any] | decl.UUIDReference] = []
+        folder_extensions: list[dict[str, t.Any] | decl.UUIDReference] = []
         for item in self.tracker["items"]:
             if "children" in item:
                 type = "Folder"
-                second_key = "folders"
+                extensions = folder_extensions
             else:
                 type = "Requirement"
-                second_key = "requirements"
+                extensions = req_extensions
 
-            req = find.find_by_identifier(self.model, item["id"], type)
+            req = self._work_item_index[type].get(item["id"])
             if req is None:
-                req_actions = self.yield_requirements_create_actions(item)
-                item_action = next(req_actions)
-                _add_action_safely(base, "extend", second_key, item_action)
+                item_action = self._requirements_create_actions(
+                    item, item_actions
+                )
+                extensions.append(item_action)
             else:
                 assert isinstance(req, (reqif.Requirement, reqif.Folder))
+                mark = len(item_actions)
                 try:
-                    req_actions = self.yield_requirements_mod_actions(
-                        req, item
-                    )
+                    self._requirements_mod_actions(req, item, item_actions)
                 except act.InvalidWorkItemType as error:
+                    del item_actions[mark:]
+                    visited.add(req.identifier)
                     self._handle_user_error(
                         f"Invalid workitem '{item['id']}'. " + error.args[0]
                     )
@@ -206,20 +307,30 @@ class TrackerChange:
 
                 visited.add(req.identifier)
                 if req.parent != self.req_module:
-                    iaction = decl.UUIDReference(req.uuid)
-                    _add_action_safely(base, "extend", second_key, iaction)
+                    extensions.append(_UUIDRef(req.uuid))
                     self._location_changed.add(RMIdentifier(req.identifier))
                     self.invalidate_deletion(req)
 
-            self.actions.extend(req_actions)
-
-        for action in self._req_deletions.values():
-            if set(action) == {"parent"}:
-                self.actions.remove(action)
+        self.actions.extend(_drop_empty(item_actions))
 
-        _deep_update(base, self.req_delete_actions(visited))
-        _deep_update(base, self.req_delete_actions(visited, "folders"))
-        if set(base) != {"parent"}:
+        emptied = {
+            id(action)
+            for action in self._req_deletions.values()
+            if len(action) == 1
+        }
+        if emptied:
+            self.actions = [a for a in self.actions if id(a) not in emptied]
+
+        module_extensions: dict[str, t.Any] = {}
+        if req_extensions:
+            module_extensions["requirements"] = req_extensions
+        if folder_extensions:
+            module_extensions["folders"] = folder_extensions
+        if module_extensions:
+            base.setdefault("extend", {}).update(module_extensions)
+        if deletions := self._module_delete_actions(visited):
+            base["delete"] = deletions
+        if len(base) > 1:
             self.actions.append(base)
 
     def check_requirements_module(self) -> dict[str, t.Any]:
@@ -254,9 +365,8 @@ class TrackerChange:
 
         assert isinstance(req_module, reqif.CapellaModule)
         self.req_module = req_module
-        base: dict[str, t.Any] = {
-            "parent": decl.UUIDReference(self.req_module.uuid)
-        }
+        self._module_ref = _UUIDRef(self.req_module.uuid)
+        base: dict[str, t.Any] = {"parent": self._module_ref}
         if self.req_module.identifier != identifier:
             base["modify"] = {"identifier": identifier}
 
@@ -266,6 +376,24 @@ class TrackerChange:
 
         return base
 
+    def _build_indexes(self) -> None:
+        self._work_item_index = {
+            type: find.build_identifier_index(self.model, type)
+            for type in ("Requirement", "Folder")
+        }
+        if self.reqt_folder is None:
+            self._reqtype_index = {}
+            self._enum_dtdef_index = {}
+        else:
+            self._reqtype_index = find.build_identifier_index(
+                self.model, "RequirementType", below=self.reqt_folder
+            )
+            self._enum_dtdef_index = find.build_identifier_index(
+                self.model,
+                "EnumerationDataTypeDefinition",
+                below=self.reqt_folder,
+            )
+
     def _handle_user_error(self, message: str) -> None:
         if self.gather_logs:
             self.errors.append(message)
@@ -283,39 +411,49 @@ class TrackerChange:
         if isinstance(requirement, reqif.Folder):
             key = "folders"
 
-        try:
-            ref = decl.UUIDReference(requirement.uuid)
-            deletions = self._req_deletions[requirement.uuid]["delete"]
-            deletions[key].remove(ref)
-
-            if not deletions[key]:
-                del deletions[key]
-            if not deletions:
-                del self._req_deletions[requirement.uuid]["delete"]
-        except KeyError:
-            pass
+        action = self._req_deletions.get(requirement.uuid)
+        if action is None or "delete" not in action:
+            return
+
+        deletions = action["delete"]
+        refs = deletions.get(key, [])
+        ref = _UUIDRef(requirement.uuid)
+        if ref not in refs:
+            return
+
+        refs.remove(ref)
+        if not refs:
+            del deletions[key]
+        if not deletions:
+            del action["delete"]
 
     def req_delete_actions(
-        self,
-        visited: cabc.Iterable[str],
-        attr_name: str = "requirements",
+        self, visited: cabc.Container[str]
     ) -> dict[str, t.Any]:
         """Return an action for deleting elements under the ReqModule.
 
-        Filter all elements from the CapellaModule attribute with
-        name ``attr_name`` against ``visited``. These are the elements
-        that are still in the model but not in the snapshot, and have to
-        be deleted.
+        Filter all requirements and folders directly under the
+        CapellaModule against ``visited``. These are the elements that
+        are still in the model but not in the snapshot, and have to be
+        deleted.
         """
-        parent_ref = decl.UUIDReference(self.req_module.uuid)
-        dels = [
-            decl.UUIDReference(req.uuid)
-            for req in getattr(self.req_module, attr_name)
-            if req.identifier not in visited
-        ]
-        if not dels:
-            return {"parent": parent_ref}
-        return {"parent": parent_ref, "delete": {attr_name: dels}}
+        if deletions := self._module_delete_actions(visited):
+            return {"parent": self._module_ref, "delete": deletions}
+        return {"parent": self._module_ref}
+
+    def _module_delete_actions(
+        self, visited: cabc.Container[str]
+    ) -> dict[str, list[decl.UUIDReference]]:
+        deletions: dict[str, list[decl.UUIDReference]] = {}
+        for attr_name, children in self._module_children.items():
+            dels = [
+                _UUIDRef(req.uuid)
+                for req in children
+                if req.identifier not in visited
+            ]
+            if dels:
+                deletions[attr_name] = dels
+        return deletions
 
     def requirement_types_folder_create_action(
         self, base: dict[str, t.Any]
@@ -396,7 +534,7 @@ class TrackerChange:
             that enables AttributeDefinitions via the ``definition``
             attribute.
         """
-        attribute_definitions = list[dict[str, t.Any]]()
+        attribute_definitions: list[dict[str, t.Any]] = []
         for id, adef in req_type.get("attributes", {}).items():
             try:
                 attr_def = self.attribute_definition_create_action(
@@ -441,12 +579,7 @@ class TrackerChange:
         cls: AttributeDefinitionClass = reqif.AttributeDefinition
         if item["type"] == "Enum":
             cls = reqif.AttributeDefinitionEnumeration
-            etdef = find.find_by_identifier(
-                self.model,
-                id,
-                "EnumerationDataTypeDefinition",
-                below=self.reqt_folder,
-            )
+            etdef = self._enum_dtdef_index.get(id)
             if etdef is None:
                 promise_id = f"EnumerationDataTypeDefinition {id}"
                 if id not in self.data_type_definitions:
@@ -456,11 +589,9 @@ class TrackerChange:
                         "datatype definition in `data_types`."
                     )
 
-                ref: decl.Promise | decl.UUIDReference = decl.Promise(
-                    promise_id
-                )
+                ref: decl.Promise | decl.UUIDReference = _Promise(promise_id)
             else:
-                ref = decl.UUIDReference(etdef.uuid)
+                ref = _UUIDRef(etdef.uuid)
 
             base["data_type"] = ref
             base["multi_valued"] = item.get("multi_values") is not None
@@ -484,21 +615,24 @@ class TrackerChange:
         capellambse.extensions.reqif.Requirement
         capellambse.extensions.reqif.RequirementsFolder
         """
-        iid = item["id"]
-        attributes = list[dict[str, t.Any]]()
-        req_type_id = RMIdentifier(item.get("type", ""))
-        for attr_id, value in item.get("attributes", {}).items():
-            check = self._check_attribute((attr_id, value), (req_type_id, iid))
-            if check == "break":
-                break
-            elif check == "continue":
-                continue
+        actions: list[dict[str, t.Any] | None] = []
+        yield self._requirements_create_actions(item, actions)
+        yield from _drop_empty(actions)
 
-            self._try_create_attribute_value(
-                (attr_id, value), (req_type_id, iid), attributes
-            )
+    def _requirements_create_actions(
+        self, item: act.WorkItem, actions: list[dict[str, t.Any] | None]
+    ) -> dict[str, t.Any]:
+        stack: list[_WorkItemFrame] = []
+        base = self._enter_requirements_create_action(item, stack)
+        self._walk_work_items(stack, actions)
+        return base
 
-        identifier = RMIdentifier(str(item["id"]))
+    def _enter_requirements_create_action(
+        self, item: act.WorkItem, stack: list[_WorkItemFrame]
+    ) -> dict[str, t.Any]:
+        iid = item["id"]
+        req_type_id = RMIdentifier(_intern(item.get("type", "")))
+        identifier = RMIdentifier(str(iid))
         base: dict[str, t.Any] = {
             "long_name": item["long_name"],
             "identifier": identifier,
@@ -506,61 +640,97 @@ class TrackerChange:
         if text := item.get("text"):
             base["text"] = text
 
-        if attributes:
-            base["attributes"] = attributes
+        if item_attributes := item.get("attributes"):
+            attributes: list[dict[str, t.Any]] = []
+            for attr_id, value in item_attributes.items():
+                check = self._check_attribute(
+                    (attr_id, value), (req_type_id, iid)
+                )
+                if check == "break":
+                    break
+                elif check == "continue":
+                    continue
+
+                self._try_create_attribute_value(
+                    (attr_id, value), (req_type_id, iid), attributes
+                )
+
+            if attributes:
+                base["attributes"] = attributes
 
         if req_type_id:
-            reqtype = find.find_by_identifier(
-                self.model,
-                req_type_id,
-                "RequirementType",
-                below=self.reqt_folder,
-            )
+            reqtype = self._reqtype_index.get(req_type_id)
             if reqtype is None:
-                base["type"] = decl.Promise(f"RequirementType {req_type_id}")
+                base["type"] = _Promise(f"RequirementType {req_type_id}")
             else:
-                base["type"] = decl.UUIDReference(reqtype.uuid)
+                base["type"] = _UUIDRef(reqtype.uuid)
 
-        child_mods: list[dict[str, t.Any]] = []
         if "children" in item:
             base["requirements"] = []
             base["folders"] = []
-            child: act.WorkItem
-            for child in item["children"]:
-                if "children" in child:
-                    key = "folders"
-                    creq = find.find_by_identifier(
-                        self.model, child["id"], "Folder"
-                    )
-                else:
-                    key = "requirements"
-                    creq = find.find_by_identifier(
-                        self.model, child["id"], "Requirement"
-                    )
+            stack.append(_CreateFrame(base))
+            containers = (base["requirements"], base["folders"])
+            parent = _Promise(identifier)
+            for child in reversed(item["children"]):
+                stack.append(_ChildFrame(child, parent, containers))
+        return base
 
-                action: dict[str, t.Any] | decl.UUIDReference
-                if creq is None:
-                    child_actions = self.yield_requirements_create_actions(
-                        child
-                    )
-                    # pylint: disable=stop-iteration-return
-                    action = next(child_actions)
-                else:
-                    assert isinstance(creq, (reqif.Requirement, reqif.Folder))
-                    child_actions = self.yield_requirements_mod_actions(
-                        creq, child, decl.Promise(identifier)
-                    )
-                    action = decl.UUIDReference(creq.uuid)
+    def _enter_child_action(
+        self,
+        frame: _ChildFrame,
+        actions: list[dict[str, t.Any] | None],
+        stack: list[_WorkItemFrame],
+    ) -> None:
+        child = frame.item
+        cid = RMIdentifier(str(child["id"]))
+        if "children" in child:
+            creq = self._work_item_index["Folder"].get(cid)
+            container = frame.containers[1]
+        else:
+            creq = self._work_item_index["Requirement"].get(cid)
+            container = frame.containers[0]
+
+        if creq is None:
+            action = self._enter_requirements_create_action(child, stack)
+            container.append(action)
+            return
+
+        assert isinstance(creq, (reqif.Requirement, reqif.Folder))
+        try:
+            self._enter_requirements_mod_action(
+                creq, child, frame.parent, actions, stack
+            )
+        except act.InvalidWorkItemType as error:
+            self._handle_user_error(
+                f"Invalid workitem '{child['id']}'. " + error.args[0]
+            )
+            return
 
-                base[key].append(action)
-                child_mods.extend(child_actions)
+        if creq.parent != frame.parent:
+            container.append(_UUIDRef(creq.uuid))
+
+    def _walk_work_items(
+        self,
+        stack: list[_WorkItemFrame],
+        actions: list[dict[str, t.Any] | None],
+    ) -> None:
+        """Process the work item tree on ``stack`` depth-first.
 
-            if not base["folders"]:
-                del base["folders"]
-            if not base["requirements"]:
-                del base["requirements"]
-        yield base
-        yield from child_mods
+        Actions are collected in ``actions`` in the order of the tree.
+        Slots of modification actions that turned out to be empty are
+        set to ``None``.
+        """
+        while stack:
+            frame = stack.pop()
+            if isinstance(frame, _ChildFrame):
+                self._enter_child_action(frame, actions, stack)
+            elif isinstance(frame, _CreateFrame):
+                if not frame.base["folders"]:
+                    del frame.base["folders"]
+                if not frame.base["requirements"]:
+                    del frame.base["requirements"]
+            else:
+                self._finish_folder_mod_action(frame, actions)
 
     def _check_attribute(
         self,
@@ -576,11 +746,11 @@ class TrackerChange:
             )
             return "break"
 
-        if _blacklisted(id, value):
+        if id in _ATTR_BLACKLIST_NAMES and _blacklisted(id, value):
             return "continue"
 
-        reqtype_defs = self.requirement_types.get(req_type_id)
-        if reqtype_defs and id not in reqtype_defs["attributes"]:
+        attr_names = self._reqtype_attr_names.get(req_type_id)
+        if attr_names is not None and id not in attr_names:
             self._handle_user_error(
                 f"Invalid workitem '{iitem_id}'. "
                 f"Invalid field found: field identifier '{id}' not defined in "
@@ -632,12 +802,7 @@ class TrackerChange:
         if builder.deftype == "Enum":
             deftype += "Enumeration"
             assert isinstance(builder.value, list)
-            edtdef = find.find_by_identifier(
-                self.model,
-                id,
-                "EnumerationDataTypeDefinition",
-                below=self.reqt_folder,
-            )
+            edtdef = self._enum_dtdef_index.get(id)
 
             for evid in builder.value:
                 if isinstance(evid, decl.UUIDReference):
@@ -655,10 +820,10 @@ class TrackerChange:
                 )
                 ev_ref: decl.Promise | decl.UUIDReference
                 if enumvalue is None or evid in self._evdeletions:
-                    ev_ref = decl.Promise(f"EnumValue {id} {evid}")
+                    ev_ref = _Promise(f"EnumValue {id} {evid}")
                     assert ev_ref is not None
                 else:
-                    ev_ref = decl.UUIDReference(enumvalue.uuid)
+                    ev_ref = _UUIDRef(enumvalue.uuid)
 
                 values.append(ev_ref)
 
@@ -675,9 +840,9 @@ class TrackerChange:
                     "promised."
                 )
             else:
-                definition_ref = decl.Promise(promise_id)
+                definition_ref = _Promise(promise_id)
         else:
-            definition_ref = decl.UUIDReference(definition.uuid)
+            definition_ref = _UUIDRef(definition.uuid)
 
         return {
             "_type": builder.deftype.lower(),
@@ -704,9 +869,8 @@ class TrackerChange:
             A data-class that gathers all needed data for creating the
             `(Enumeration)AttributeValue`.
         """
-        reqtype_attr_defs = self.requirement_types[req_type_id]["attributes"]
-        deftype = reqtype_attr_defs[id]["type"]
-        if default_type := _ATTR_VALUE_DEFAULT_MAP.get(deftype):
+        deftype, default_type, key = self._attr_schema[req_type_id][id]
+        if default_type is not None:
             matches_type = isinstance(value, default_type)
         else:
             matches_type = True
@@ -722,8 +886,8 @@ class TrackerChange:
             )
 
         if deftype == "Enum":
-            datatype = self.data_type_definitions.get(id)
-            if datatype is None:
+            options = self._enum_options.get(id)
+            if options is None:
                 raise act.InvalidFieldValue(
                     f"Invalid field found: {id!r}. Missing its "
                     "datatype definition in `data_types`."
@@ -731,14 +895,14 @@ class TrackerChange:
 
             assert isinstance(value, cabc.Iterable)
             assert not isinstance(value, str)
-            options = (value["id"] for value in datatype["values"])
-            key = "values"
-            if not set(value) & set(options):
+            try:
+                invalid = options.isdisjoint(value)
+            except TypeError:
+                invalid = True
+            if invalid:
                 raise act.InvalidFieldValue(
                     f"Invalid field found: {key} {value!r} for {id!r}"
                 )
-        else:
-            key = "value"
 
         return _AttributeValueBuilder(deftype, key, value)
 
@@ -753,14 +917,14 @@ class TrackerChange:
         """
         assert self.reqt_folder
         dt_defs_deletions: list[decl.UUIDReference] = [
-            decl.UUIDReference(dtdef.uuid)
+            _UUIDRef(dtdef.uuid)
             for dtdef in self.reqt_folder.data_type_definitions
             if dtdef.identifier not in self.data_type_definitions
         ]
         self._populate_ev_deletions(dt_defs_deletions)
 
-        dt_defs_creations = list[dict[str, t.Any]]()
-        dt_defs_modifications = list[dict[str, t.Any]]()
+        dt_defs_creations: list[dict[str, t.Any]] = []
+        dt_defs_modifications: list[dict[str, t.Any]] = []
         for id, ddef in self.data_type_definitions.items():
             action = self.data_type_mod_action(id, ddef)
             if action is None:
@@ -771,9 +935,8 @@ class TrackerChange:
             else:
                 dt_defs_creations.append(action)
 
-        base: dict[str, t.Any] = {
-            "parent": decl.UUIDReference(self.reqt_folder.uuid)
-        }
+        assert self._reqt_folder_ref
+        base: dict[str, t.Any] = {"parent": self._reqt_folder_ref}
         if dt_defs_creations:
             base["extend"] = {"data_type_definitions": dt_defs_creations}
         if dt_defs_deletions:
@@ -806,51 +969,50 @@ class TrackerChange:
             Either an create- or mod-action or ``None`` if nothing
             changed.
         """
-        assert self.reqt_folder
-        try:
-            dtdef = self.reqt_folder.data_type_definitions.by_identifier(
-                id, single=True
-            )
-            base: dict[str, t.Any] = {"parent": decl.UUIDReference(dtdef.uuid)}
-            mods = dict[str, t.Any]()
-            if dtdef.long_name != ddef["long_name"]:
-                mods["long_name"] = ddef["long_name"]
-
-            if mods:
-                base["modify"] = mods
-
-            creations = [
-                value
-                for value in ddef["values"]
-                if value["id"] not in dtdef.values.by_identifier
-            ]
-            action = self.data_type_create_action(
-                id, {"long_name": ddef["long_name"], "values": creations}
-            )
-            if creations:
-                base["extend"] = {"values": action["values"]}
+        dtdef = self._enum_dtdef_index.get(id)
+        if dtdef is None:
+            return self.data_type_create_action(id, ddef)
 
-            deletions = set(dtdef.values.by_identifier) - set(
-                value["id"] for value in ddef["values"]
-            )
-            if deletions:
-                evs = dtdef.values.by_identifier(*deletions)
-                self._evdeletions |= deletions
-                base["delete"] = {
-                    "values": [decl.UUIDReference(ev.uuid) for ev in evs]
-                }
+        base: dict[str, t.Any] = {"parent": _UUIDRef(dtdef.uuid)}
+        mods: dict[str, t.Any] = {}
+        if dtdef.long_name != ddef["long_name"]:
+            mods["long_name"] = ddef["long_name"]
 
-            if set(base) == {"parent"}:
-                return None
-            return base
-        except KeyError:
-            return self.data_type_create_action(id, ddef)
+        if mods:
+            base["modify"] = mods
+
+        enum_values = list(dtdef.values)
+        existing = {ev.identifier for ev in enum_values}
+        current = {value["id"] for value in ddef["values"]}
+        creations = [
+            value for value in ddef["values"] if value["id"] not in existing
+        ]
+        action = self.data_type_create_action(
+            id, {"long_name": ddef["long_name"], "values": creations}
+        )
+        if creations:
+            base["extend"] = {"values": action["values"]}
+
+        deletions = existing - current
+        if deletions:
+            self._evdeletions |= deletions
+            base["delete"] = {
+                "values": [
+                    _UUIDRef(ev.uuid)
+                    for ev in enum_values
+                    if ev.identifier in deletions
+                ]
+            }
+
+        if len(base) == 1:
+            return None
+        return base
 
     def requirement_type_delete_actions(self) -> list[decl.UUIDReference]:
         r"""Populate actions for deleting ``RequirementType``\ s."""
         assert self.reqt_folder
         dels = [
-            decl.UUIDReference(reqtype.uuid)
+            _UUIDRef(reqtype.uuid)
             for reqtype in self.reqt_folder.requirement_types
             if RMIdentifier(reqtype.identifier) not in self.requirement_types
         ]
@@ -859,63 +1021,59 @@ class TrackerChange:
     def requirement_type_mod_action(
         self, identifier: RMIdentifier, item: act.RequirementType
     ) -> None | dict[str, t.Any]:
-        assert self.reqt_folder
+        reqtype = self._reqtype_index.get(identifier)
+        if reqtype is None:
+            return self.requirement_type_create_action(identifier, item)
+
+        assert isinstance(reqtype, reqif.RequirementType)
         try:
-            reqtype = self.reqt_folder.requirement_types.by_identifier(
-                identifier, single=True
+            mods = _compare_simple_attributes(
+                reqtype, item, filter=_REQTYPE_FILTER
             )
-            assert isinstance(reqtype, reqif.RequirementType)
-
-            try:
-                mods = _compare_simple_attributes(
-                    reqtype, item, filter=("attributes",)
-                )
-            except AttributeError as error:
-                self._handle_user_error(
-                    f"Invalid workitem '{identifier}'. {error.args[0]}"
-                )
-
-            attribute_definition_ids = {
-                f"{id} {reqtype.identifier}" for id in item["attributes"]
-            }
-            attr_defs_deletions: list[decl.UUIDReference] = [
-                decl.UUIDReference(adef.uuid)
-                for adef in reqtype.attribute_definitions
-                if adef.identifier not in attribute_definition_ids
-            ]
+        except AttributeError as error:
+            self._handle_user_error(
+                f"Invalid workitem '{identifier}'. {error.args[0]}"
+            )
+            mods = {}
+
+        attributes = item.get("attributes", {})
+        attribute_definition_ids = {f"{id} {identifier}" for id in attributes}
+        attr_defs = list(reqtype.attribute_definitions)
+        attr_defs_deletions: list[decl.UUIDReference] = [
+            _UUIDRef(adef.uuid)
+            for adef in attr_defs
+            if adef.identifier not in attribute_definition_ids
+        ]
 
-            attr_defs_creations = list[dict[str, t.Any]]()
-            attr_defs_modifications = list[dict[str, t.Any]]()
-            for id, data in item["attributes"].items():
-                action = self.attribute_definition_mod_action(
-                    reqtype, id, data
-                )
-                if action is None:
-                    continue
+        attr_defs_index = _index_by_identifier(attr_defs)
+        attr_defs_creations: list[dict[str, t.Any]] = []
+        attr_defs_modifications: list[dict[str, t.Any]] = []
+        for id, data in attributes.items():
+            action = self.attribute_definition_mod_action(
+                reqtype, id, data, identifier, attr_defs_index
+            )
+            if action is None:
+                continue
 
-                if "parent" in action:
-                    attr_defs_modifications.append(action)
-                else:
-                    attr_defs_creations.append(action)
+            if "parent" in action:
+                attr_defs_modifications.append(action)
+            else:
+                attr_defs_creations.append(action)
 
-            base: dict[str, t.Any] = {
-                "parent": decl.UUIDReference(reqtype.uuid)
-            }
-            if mods:
-                base["modify"] = mods
+        base: dict[str, t.Any] = {"parent": _UUIDRef(reqtype.uuid)}
+        if mods:
+            base["modify"] = mods
 
-            if attr_defs_creations:
-                base["extend"] = {"attribute_definitions": attr_defs_creations}
-            if attr_defs_deletions:
-                base["delete"] = {"attribute_definitions": attr_defs_deletions}
+        if attr_defs_creations:
+            base["extend"] = {"attribute_definitions": attr_defs_creations}
+        if attr_defs_deletions:
+            base["delete"] = {"attribute_definitions": attr_defs_deletions}
 
-            if set(base) != {"parent"}:
-                self.actions.append(base)
+        if len(base) > 1:
+            self.actions.append(base)
 
-            self.actions.extend(attr_defs_modifications)
-            return None
-        except KeyError:
-            return self.requirement_type_create_action(identifier, item)
+        self.actions.extend(attr_defs_modifications)
+        return None
 
     def yield_requirements_mod_actions(
         self,
@@ -928,23 +1086,44 @@ class TrackerChange:
         If any modifications to simple attributes (e.g. ``long_name``),
         attributes or creations/deletions of children
         (in case of ``req`` being a Folder) were identified an action
-        for modification of ``req`` is yielded. For modifications of
-        children the method is called recursively and yields actions
-        from it.
+        for modification of ``req`` is yielded. Actions for
+        modifications of children are yielded afterwards.
         """
-        base: dict[str, t.Any] = {"parent": decl.UUIDReference(req.uuid)}
+        actions: list[dict[str, t.Any] | None] = []
+        self._requirements_mod_actions(req, item, actions, parent)
+        yield from _drop_empty(actions)
+
+    def _requirements_mod_actions(
+        self,
+        req: reqif.CapellaModule | WorkItem,
+        item: dict[str, t.Any] | act.WorkItem,
+        actions: list[dict[str, t.Any] | None],
+        parent: reqif.CapellaModule | WorkItem | decl.Promise | None = None,
+    ) -> None:
+        stack: list[_WorkItemFrame] = []
+        self._enter_requirements_mod_action(req, item, parent, actions, stack)
+        self._walk_work_items(stack, actions)
+
+    def _enter_requirements_mod_action(
+        self,
+        req: reqif.CapellaModule | WorkItem,
+        item: dict[str, t.Any] | act.WorkItem,
+        parent: reqif.CapellaModule | WorkItem | decl.Promise | None,
+        actions: list[dict[str, t.Any] | None],
+        stack: list[_WorkItemFrame],
+    ) -> None:
+        base: dict[str, t.Any] = {"parent": _UUIDRef(req.uuid)}
         try:
-            mods = _compare_simple_attributes(
-                req, item, filter=("id", "type", "attributes", "children")
-            )
+            mods = _compare_simple_attributes(req, item, filter=_REQ_FILTER)
         except AttributeError as error:
             self._handle_user_error(
                 f"Invalid workitem '{item['id']}'. {error.args[0]}"
             )
             return
 
-        req_type_id = RMIdentifier(item.get("type", ""))
-        attributes_deletions = list[decl.UUIDReference]()
+        req_type_id = RMIdentifier(_intern(item.get("type", "")))
+        attrs = list(req.attributes)
+        attributes_deletions: list[decl.UUIDReference] = []
         if req_type_id != req.type.identifier:
             if req_type_id and req_type_id not in self.requirement_types:
                 raise act.InvalidWorkItemType(
@@ -952,25 +1131,40 @@ class TrackerChange:
                     f"Unknown workitem-type {req_type_id!r}"
                 )
 
-            reqtype = find.find_by_identifier(
-                self.model,
-                req_type_id,
-                "RequirementType",
-                below=self.reqt_folder,
-            )
+            reqtype = self._reqtype_index.get(req_type_id)
             if reqtype is None:
-                mods["type"] = decl.Promise(req_type_id)
+                mods["type"] = _Promise(req_type_id)
             else:
-                mods["type"] = decl.UUIDReference(reqtype.uuid)
+                mods["type"] = _UUIDRef(reqtype.uuid)
 
-            attributes_deletions = [
-                decl.UUIDReference(attr.uuid) for attr in req.attributes
-            ]
+            attributes_deletions = [_UUIDRef(attr.uuid) for attr in attrs]
 
         iid = item["id"]
         item_attributes = item.get("attributes", {})
-        attributes_creations = list[dict[str, t.Any]]()
-        attributes_modifications = list[dict[str, t.Any]]()
+        type_changed = "type" in mods
+        model_attributes: list[_ModelAttribute] = []
+        current_values = None
+        if not type_changed:
+            model_attributes = _read_model_attributes(attrs)
+            current_values = _current_attribute_values(model_attributes)
+
+        unchanged = False
+        unchanged_ids: cabc.Container[str] = ()
+        if current_values is not None:
+            snapshot_values = _snapshot_attribute_values(
+                item_attributes, req_type_id
+            )
+            unchanged = current_values == snapshot_values
+            if not unchanged:
+                unchanged_ids = {
+                    id
+                    for id, value in snapshot_values.items()
+                    if id in current_values and current_values[id] == value
+                }
+
+        attributes_creations: list[dict[str, t.Any]] = []
+        attributes_modifications: list[dict[str, t.Any]] = []
+        attrs_by_definition: dict[str, AttributeValue | None] | None = None
         for id, value in item_attributes.items():
             check = self._check_attribute((id, value), (req_type_id, iid))
             if check == "break":
@@ -979,14 +1173,25 @@ class TrackerChange:
                 continue
 
             action: act.Primitive | dict[str, t.Any] | None
-            if mods.get("type"):
+            if type_changed:
                 self._try_create_attribute_value(
                     (id, value), (req_type_id, iid), attributes_creations
                 )
+            elif unchanged or f"{id} {req_type_id}" in unchanged_ids:
+                try:
+                    self.check_attribute_value_is_valid(id, value, req_type_id)
+                except act.InvalidFieldValue as error:
+                    self._handle_user_error(
+                        f"Invalid workitem '{iid}'. {error.args[0]}"
+                    )
             else:
+                if attrs_by_definition is None:
+                    attrs_by_definition = _attributes_by_definition(
+                        model_attributes
+                    )
                 try:
                     action = self.attribute_value_mod_action(
-                        req, id, value, req_type_id
+                        req, id, value, req_type_id, attrs_by_definition
                     )
                     if action is None:
                         continue
@@ -1004,11 +1209,11 @@ class TrackerChange:
         attribute_definition_ids = {
             f"{attr} {req_type_id}" for attr in item_attributes
         }
-        if not attributes_deletions:
+        if not (attributes_deletions or unchanged):
             attributes_deletions = [
-                decl.UUIDReference(attr.uuid)
-                for attr in req.attributes
-                if attr.definition.identifier not in attribute_definition_ids
+                _UUIDRef(mattr.attribute.uuid)
+                for mattr in model_attributes
+                if mattr.definition_id not in attribute_definition_ids
             ]
 
         if mods:
@@ -1026,86 +1231,63 @@ class TrackerChange:
             assert not isinstance(req, reqif.CapellaModule)
             self.invalidate_deletion(req)
 
-        children = item.get("children", [])
-        cr_creations: list[dict[str, t.Any] | decl.UUIDReference] = []
-        cf_creations: list[dict[str, t.Any] | decl.UUIDReference] = []
-        containers = [cr_creations, cf_creations]
-        child_mods: list[dict[str, t.Any]] = []
+        index = len(actions)
+        actions.append(base)
+        actions.extend(attributes_modifications)
         if isinstance(req, reqif.Folder):
-            child_req_ids = set[RMIdentifier]()
-            child_folder_ids = set[RMIdentifier]()
+            child_req_ids: set[RMIdentifier] = set()
+            child_folder_ids: set[RMIdentifier] = set()
+            children = item.get("children", [])
             for child in children:
                 cid = RMIdentifier(str(child["id"]))
                 if "children" in child:
-                    key = "folders"
                     child_folder_ids.add(cid)
-                    creq = find.find_by_identifier(self.model, cid, "Folder")
                 else:
-                    key = "requirements"
                     child_req_ids.add(cid)
-                    creq = find.find_by_identifier(
-                        self.model, cid, "Requirement"
-                    )
 
-                container = containers[key == "folders"]
-                if creq is None:
-                    child_actions = self.yield_requirements_create_actions(
-                        child
-                    )
-                    # pylint: disable=stop-iteration-return
-                    action = next(child_actions)
-                    container.append(action)
-                else:
-                    assert isinstance(creq, (reqif.Requirement, reqif.Folder))
-                    try:
-                        child_actions = self.yield_requirements_mod_actions(
-                            creq, child, req
-                        )
-                    except act.InvalidWorkItemType as error:
-                        self._handle_user_error(
-                            f"Invalid workitem '{child['id']}'. "
-                            + error.args[0]
-                        )
-                        continue
-
-                    if creq.parent != req:
-                        container.append(decl.UUIDReference(creq.uuid))
-
-                child_mods.extend(child_actions)
-
-            creations = dict[str, t.Any]()
-            if cr_creations:
-                creations["requirements"] = cr_creations
-            if cf_creations:
-                creations["folders"] = cf_creations
-            if creations:
-                _deep_update(base, {"extend": creations})
-
-            fold_dels = make_requirement_delete_actions(
-                req, child_folder_ids | self._location_changed, "folders"
-            )
-            req_dels = make_requirement_delete_actions(
-                req, child_req_ids | self._location_changed
+            frame = _FolderFrame(
+                base, req, index, ([], []), child_req_ids, child_folder_ids
             )
-            children_deletions = dict[str, t.Any]()
-            if fold_dels:
-                children_deletions["folders"] = fold_dels
-            if req_dels:
-                children_deletions["requirements"] = req_dels
-            if children_deletions:
-                _deep_update(base, {"delete": children_deletions})
-            for del_ref in req_dels + fold_dels:
-                self._req_deletions[del_ref.uuid] = base
-
-        if (
-            base.get("extend", {})
-            or base.get("modify", {})
-            or base.get("delete", {})
-        ):
-            yield base
-
-        yield from attributes_modifications
-        yield from child_mods
+            stack.append(frame)
+            for child in reversed(children):
+                stack.append(_ChildFrame(child, req, frame.containers))
+        elif not ("extend" in base or "modify" in base or "delete" in base):
+            actions[index] = None
+
+    def _finish_folder_mod_action(
+        self, frame: _FolderFrame, actions: list[dict[str, t.Any] | None]
+    ) -> None:
+        base, req = frame.base, frame.req
+        cr_creations, cf_creations = frame.containers
+        creations: dict[str, t.Any] = {}
+        if cr_creations:
+            creations["requirements"] = cr_creations
+        if cf_creations:
+            creations["folders"] = cf_creations
+        if creations:
+            base.setdefault("extend", {}).update(creations)
+
+        fold_dels = make_requirement_delete_actions(
+            req,
+            frame.child_folder_ids,
+            "folders",
+            extra_keep=self._location_changed,
+        )
+        req_dels = make_requirement_delete_actions(
+            req, frame.child_req_ids, extra_keep=self._location_changed
+        )
+        children_deletions: dict[str, t.Any] = {}
+        if fold_dels:
+            children_deletions["folders"] = fold_dels
+        if req_dels:
+            children_deletions["requirements"] = req_dels
+        if children_deletions:
+            base.setdefault("delete", {}).update(children_deletions)
+        for del_ref in req_dels + fold_dels:
+            self._req_deletions[del_ref.uuid] = base
+
+        if not ("extend" in base or "modify" in base or "delete" in base):
+            actions[frame.action_index] = None
 
     def attribute_value_mod_action(
         self,
@@ -1113,6 +1295,9 @@ class TrackerChange:
         id: str,
         valueid: str | list[str | decl.UUIDReference | decl.Promise],
         req_type_id: RMIdentifier,
+        attributes_by_definition: (
+            cabc.Mapping[str, AttributeValue | None] | None
+        ) = None,
     ) -> dict[str, t.Any] | None:
         """Return an action for modifying an ``AttributeValue``.
 
@@ -1137,6 +1322,10 @@ class TrackerChange:
             The identifier of ``RequirementType`` for given ``req`` if
             it was changed. If not given or ``None`` the identifier
             ``req.type.identifier`` is taken.
+        attributes_by_definition : optional
+            A lookup of the attributes of ``req`` by the identifier of
+            their definition. If not given it is built from
+            ``req.attributes``.
 
         Returns
         -------
@@ -1149,24 +1338,28 @@ class TrackerChange:
         if builder.deftype == "Enum":
             deftype += "Enumeration"
 
-        attrdef = find.find_by_identifier(
-            self.model, f"{id} {req_type_id}", deftype, below=self.reqt_folder
-        )
-        attr = req.attributes.by_definition(attrdef, single=True)
-        assert attrdef is not None
+        if attributes_by_definition is None:
+            attributes_by_definition = _attributes_by_definition(
+                _read_model_attributes(req.attributes)
+            )
+
+        attr = attributes_by_definition.get(f"{id} {req_type_id}")
+        if attr is None or type(attr.definition).__name__ != deftype:
+            raise KeyError(f"No attribute value found for {id!r}")
+
+        attrdef = attr.definition
         if isinstance(attr, reqif.EnumerationValueAttribute):
             assert isinstance(valueid, list)
-            actual = set(attr.values.by_identifier)
-            delete = actual - set(valueid)
-            create = set(valueid) - actual
-            differ = bool(create) or bool(delete)
-            options = attrdef.data_type.values.by_identifier
-            valueid = [
-                decl.Promise(f"EnumValue {id} {v}")
-                if v not in options
-                else decl.UUIDReference(options(v, single=True).uuid)
-                for v in create | (actual - delete)
-            ]
+            wanted = set(t.cast(list[str], valueid))
+            differ = wanted != set(attr.values.by_identifier)
+            if differ:
+                options = _index_by_identifier(attrdef.data_type.values)
+                valueid = [
+                    _Promise(f"EnumValue {id} {v}")
+                    if (option := options.get(v)) is None
+                    else _UUIDRef(option.uuid)
+                    for v in wanted
+                ]
             key = "values"
         else:
             differ = bool(attr.value != valueid)
@@ -1174,7 +1367,7 @@ class TrackerChange:
 
         if differ:
             return {
-                "parent": decl.UUIDReference(attr.uuid),
+                "parent": _UUIDRef(attr.uuid),
                 "modify": {key: valueid},
             }
         return None
@@ -1184,6 +1377,10 @@ class TrackerChange:
         reqtype: reqif.RequirementType,
         identifier: str,
         data: act.AttributeDefinition | act.EnumAttributeDefinition,
+        reqtype_id: RMIdentifier | None = None,
+        attribute_definitions: (
+            cabc.Mapping[str, reqif.ReqIFElement | None] | None
+        ) = None,
     ) -> dict[str, t.Any] | None:
         """Return an action for an ``AttributeDefinition``.
 
@@ -1192,18 +1389,29 @@ class TrackerChange:
         can be found via its ``identifier``, it is compared against the
         snapshot. If any changes are identified an action for
         modification is returned else None. If the definition can't be
-        found an action for creation is returned.
+        found an action for creation is returned. The identifier of
+        ``reqtype`` is read from the model if ``reqtype_id`` isn't
+        given. Definitions are looked up in ``attribute_definitions``
+        by their identifier if given, else in
+        ``reqtype.attribute_definitions``.
 
         Returns
         -------
         action
             Either a create-, mod-action or ``None`` if nothing changed.
         """
-        try:
-            attrdef = reqtype.attribute_definitions.by_identifier(
-                f"{identifier} {reqtype.identifier}", single=True
+        if reqtype_id is None:
+            reqtype_id = RMIdentifier(reqtype.identifier)
+        if attribute_definitions is None:
+            attribute_definitions = _index_by_identifier(
+                reqtype.attribute_definitions
             )
-            mods = dict[str, t.Any]()
+        try:
+            attrdef = attribute_definitions.get(f"{identifier} {reqtype_id}")
+            if attrdef is None:
+                raise KeyError(identifier)
+
+            mods: dict[str, t.Any] = {}
             if attrdef.long_name != data["long_name"]:
                 mods["long_name"] = data["long_name"]
             if data["type"] == "Enum":
@@ -1216,11 +1424,11 @@ class TrackerChange:
                     ]
             if not mods:
                 return None
-            return {"parent": decl.UUIDReference(attrdef.uuid), "modify": mods}
+            return {"parent": _UUIDRef(attrdef.uuid), "modify": mods}
         except KeyError:
             try:
                 return self.attribute_definition_create_action(
-                    identifier, data, reqtype.identifier
+                    identifier, data, reqtype_id
                 )
             except act.InvalidAttributeDefinition as error:
                 self._handle_user_error(
@@ -1230,36 +1438,151 @@ class TrackerChange:
                 return None
 
 
+def _build_attribute_schema(
+    requirement_types: cabc.Mapping[RMIdentifier, act.RequirementType]
+) -> dict[RMIdentifier, dict[str, _AttributeSchema]]:
+    """Return the value type and key per attribute of each RequirementType."""
+    schema: dict[RMIdentifier, dict[str, _AttributeSchema]] = {}
+    for identifier, reqtype in requirement_types.items():
+        attr_schema = schema[RMIdentifier(_intern(identifier))] = {}
+        for id, adef in reqtype.get("attributes", {}).items():
+            deftype = adef["type"]
+            key = "values" if deftype == "Enum" else "value"
+            expected_type = _ATTR_VALUE_DEFAULT_MAP.get(deftype)
+            attr_schema[id] = _AttributeSchema(deftype, expected_type, key)
+    return schema
+
+
 def make_requirement_delete_actions(
     req: reqif.Folder,
-    child_ids: cabc.Container[RMIdentifier],
+    child_ids: cabc.Set[RMIdentifier],
     key: str = "requirements",
+    extra_keep: cabc.Set[RMIdentifier] = frozenset(),
 ) -> list[decl.UUIDReference]:
     """Return actions for deleting elements behind ``req.key``.
 
     The returned list is filtered against the ``identifier`` from given
-    ``child_ids``.
+    ``child_ids`` and ``extra_keep``.
     """
-    return [
-        decl.UUIDReference(creq.uuid)
-        for creq in getattr(req, key)
-        if creq.identifier not in child_ids
-    ]
+    deletions: list[decl.UUIDReference] = []
+    for creq in getattr(req, key):
+        identifier = creq.identifier
+        if identifier not in child_ids and identifier not in extra_keep:
+            deletions.append(_UUIDRef(creq.uuid))
+    return deletions
+
+
+def _index_by_identifier(
+    elements: cabc.Iterable[reqif.ReqIFElement],
+) -> dict[str, reqif.ReqIFElement | None]:
+    """Return a lookup of ``elements`` by their ``identifier``.
+
+    Identifiers that are shared by multiple elements map to ``None``.
+    """
+    index: dict[str, reqif.ReqIFElement | None] = {}
+    for element in elements:
+        identifier = element.identifier
+        index[identifier] = None if identifier in index else element
+    return index
+
+
+def _read_model_attributes(
+    attributes: cabc.Iterable[AttributeValue],
+) -> list[_ModelAttribute]:
+    r"""Read definition identifiers and values of ``attributes`` once.
+
+    Values of ``EnumerationValueAttribute``\ s are given as a set of
+    EnumValue identifiers.
+    """
+    model_attributes: list[_ModelAttribute] = []
+    for attr in attributes:
+        definition = attr.definition
+        definition_id = None if definition is None else definition.identifier
+        if isinstance(attr, reqif.EnumerationValueAttribute):
+            value: t.Any = frozenset(attr.values.by_identifier)
+        else:
+            value = attr.value
+        model_attributes.append(_ModelAttribute(attr, definition_id, value))
+    return model_attributes
+
+
+def _attributes_by_definition(
+    model_attributes: cabc.Iterable[_ModelAttribute],
+) -> dict[str, AttributeValue | None]:
+    """Return a lookup of attributes by their definition identifier.
+
+    Definitions that are shared by multiple attributes map to ``None``.
+    """
+    lookup: dict[str, AttributeValue | None] = {}
+    for attr, identifier, _ in model_attributes:
+        if identifier is not None:
+            lookup[identifier] = None if identifier in lookup else attr
+    return lookup
+
+
+def _current_attribute_values(
+    model_attributes: cabc.Iterable[_ModelAttribute],
+) -> dict[str, t.Any] | None:
+    """Return the values of ``model_attributes`` by definition identifier.
+
+    If an attribute has no definition or multiple attributes share one,
+    ``None`` is returned.
+    """
+    values: dict[str, t.Any] = {}
+    for _, identifier, value in model_attributes:
+        if identifier is None or identifier in values:
+            return None
+        values[identifier] = value
+    return values
+
+
+def _snapshot_attribute_values(
+    attributes: cabc.Mapping[str, t.Any], req_type_id: RMIdentifier
+) -> dict[str, t.Any]:
+    """Return the snapshot counterpart of :func:`_current_attribute_values`.
+
+    Blacklisted attributes are skipped. Lists with unhashable elements
+    are given as a placeholder that doesn't compare equal to any value,
+    such that they are treated as changed and validated.
+    """
+    values: dict[str, t.Any] = {}
+    for id, value in attributes.items():
+        if id in _ATTR_BLACKLIST_NAMES and _blacklisted(id, value):
+            continue
+
+        if isinstance(value, list):
+            try:
+                value = frozenset(value)
+            except TypeError:
+                # A fresh object never equals the model value
+                value = object()
+        values[f"{id} {req_type_id}"] = value
+    return values
 
 
 def _blacklisted(name: str, value: act.Primitive | None) -> bool:
     """Identify if a key value pair is supported."""
     if value is None:
         return False
-    if not isinstance(value, cabc.Iterable) or isinstance(value, str):
+    if isinstance(value, str) or not isinstance(value, cabc.Iterable):
         return (name, value) in _ATTR_BLACKLIST
-    return all((_blacklisted(name, val) for val in value))
+    stack: list[t.Any] = list(value)
+    while stack:
+        val = stack.pop()
+        if val is None:
+            return False
+        if isinstance(val, str) or not isinstance(val, cabc.Iterable):
+            if (name, val) not in _ATTR_BLACKLIST:
+                return False
+        else:
+            stack.extend(val)
+    return True
 
 
 def _compare_simple_attributes(
     req: reqif.ReqIFElement,
     item: dict[str, t.Any] | act.WorkItem | act.RequirementType,
-    filter: cabc.Iterable[str],
+    filter: cabc.Set[str],
 ) -> dict[str, t.Any]:
     """Return a diff dictionary about changed attributes.
 
@@ -1273,8 +1596,8 @@ def _compare_simple_attributes(
     item
         A dictionary describing the snapshotted state of `req`.
     filter
-        An iterable of attribute names on `req` that shall be ignored
-        during comparison.
+        A set of attribute names on `req` that shall be ignored during
+        comparison.
 
     Returns
     -------
@@ -1282,41 +1605,26 @@ def _compare_simple_attributes(
         A dictionary of attribute name and value pairs found to differ
         on `req` and `item`.
     """
-    type_conversion = {"text": helpers.repair_html}
     mods: dict[str, t.Any] = {}
     for name, value in item.items():
         if name in filter:
             continue
 
-        converter = type_conversion.get(name, lambda i: i)
-        converted_value = converter(value)  # type: ignore[arg-type]
+        converted_value = value
+        if (converter := _VALUE_CONVERSIONS.get(name)) is not None:
+            converted_value = converter(value)
         if getattr(req, name) != converted_value:
             mods[name] = value
     return mods
 
 
-def _add_action_safely(
-    base: dict[str, t.Any],
-    first_key: str,
-    second_key: str,
-    action: dict[str, t.Any] | decl.UUIDReference,
-) -> None:
-    try:
-        base[first_key][second_key].append(action)
-    except KeyError:
-        _deep_update(base, {first_key: {second_key: [action]}})
-
-
-def _deep_update(
-    source: cabc.MutableMapping[str, t.Any],
-    overrides: cabc.Mapping[str, t.Any],
-) -> None:
-    """Update a nested dictionary in place."""
-    for key, value in overrides.items():
-        if isinstance(value, cabc.Mapping) and value:
-            update = source.get(key, {})
-            _deep_update(update, value)
-        else:
-            update = overrides[key]
+def _intern(value: t.Any) -> t.Any:
+    """Intern ``value`` if it is a string."""
+    return sys.intern(value) if isinstance(value, str) else value
+
 
-        source[key] = update
+def _drop_empty(
+    actions: cabc.Iterable[dict[str, t.Any] | None]
+) -> cabc.Iterator[dict[str, t.Any]]:
+    """Return the given actions without the ``None`` entries."""
+    return (action for action in actions if action is not None)
@@ -35,3 +35,20 @@ def find_by_identifier(
 ) -> reqif.ReqIFElement | None:
     """Try to return a model object by its ``identifier``."""
     return find_by(model, id, *xtypes, **kw)
+
+
+def build_identifier_index(
+    model: capellambse.MelodyModel,
+    *xtypes: str,
+    below: common.GenericElement | None = None,
+) -> dict[str, reqif.ReqIFElement | None]:
+    """Return a lookup of model objects by their ``identifier``.
+
+    Identifiers that are shared by multiple objects map to ``None``,
+    matching :func:`find_by_identifier` which finds nothing for
+    ambiguous identifiers.
+    """
+    index: dict[str, reqif.ReqIFElement | None] = {}
+    for obj in model.search(*xtypes, below=below):
+        index[obj.identifier] = None if obj.identifier in index else obj
+    return index
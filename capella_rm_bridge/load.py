@@ -7,6 +7,11 @@ import typing as t
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 
 def load_yaml(config_path: pathlib.Path | str) -> dict[str, t.Any]:
     """Return Requirements Management (RM) Bridge YAML configuration.
@@ -35,6 +40,7 @@ def load_yaml(config_path: pathlib.Path | str) -> dict[str, t.Any]:
     config
         The whole RM Bridge configuration.
     """
-    return yaml.safe_load(
-        pathlib.Path(config_path).read_text(encoding="utf-8")
+    return yaml.load(
+        pathlib.Path(config_path).read_text(encoding="utf-8"),
+        Loader=SafeLoader,
     )
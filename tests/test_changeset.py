@@ -21,6 +21,7 @@ import pytest
 import yaml
 from capellambse import decl
 
+from capella_rm_bridge import load
 from capella_rm_bridge.changeset import (
     actiontypes,
     calculate_change_set,
@@ -35,15 +36,11 @@ from .conftest import (
 )
 
 TEST_SNAPSHOT_PATH = TEST_DATA_PATH / "snapshots"
-TEST_SNAPSHOT: actiontypes.Snapshot = yaml.safe_load(
-    (TEST_SNAPSHOT_PATH / "snapshot.yaml").read_text(encoding="utf-8")
-)
-TEST_SNAPSHOT_1 = yaml.safe_load(
-    (TEST_SNAPSHOT_PATH / "snapshot1.yaml").read_text(encoding="utf-8")
-)
-TEST_SNAPSHOT_2 = yaml.safe_load(
-    (TEST_SNAPSHOT_PATH / "snapshot2.yaml").read_text(encoding="utf-8")
+TEST_SNAPSHOT = t.cast(
+    actiontypes.Snapshot, load.load_yaml(TEST_SNAPSHOT_PATH / "snapshot.yaml")
 )
+TEST_SNAPSHOT_1 = load.load_yaml(TEST_SNAPSHOT_PATH / "snapshot1.yaml")
+TEST_SNAPSHOT_2 = load.load_yaml(TEST_SNAPSHOT_PATH / "snapshot2.yaml")
 TEST_MODULE_CHANGE = decl.load(TEST_DATA_PATH / "changesets" / "create.yaml")
 TEST_MODULE_CHANGE_1 = decl.load(TEST_MOD_CHANGESET_PATH)
 TEST_MODULE_CHANGE_2 = decl.load(TEST_DATA_PATH / "changesets" / "delete.yaml")
@@ -151,6 +148,21 @@ class TestTrackerChangeInit(ActionsTest):
         with pytest.raises(actiontypes.InvalidSnapshotModule):
             self.tracker_change(clean_model, snapshot)
 
+    def test_init_on_requirement_type_without_attributes(
+        self,
+        clean_model: capellambse.MelodyModel,
+        migration_model: capellambse.MelodyModel,
+    ) -> None:
+        """Test that RequirementTypes don't need to define attributes."""
+        snapshot = copy.deepcopy(TEST_SNAPSHOT["modules"][0])
+        reqtypes = snapshot["requirement_types"]
+        reqtypes["plain"] = {"long_name": "Plain"}  # type: ignore[index]
+
+        for model in (clean_model, migration_model):
+            tchange = self.tracker_change(model, snapshot, gather_logs=True)
+
+            assert not tchange.errors
+
 
 class TestCreateActions(ActionsTest):
     """UnitTests for all methods requesting creations."""
@@ -240,6 +252,37 @@ class TestCreateActions(ActionsTest):
 
         assert caplog.messages[0].endswith(message_end)
 
+    def test_unhashable_enum_values_are_gathered(
+        self, clean_model: capellambse.MelodyModel
+    ) -> None:
+        """Test unhashable enum values are gathered as faulty field data."""
+        tracker = copy.deepcopy(self.tracker)
+        titem = tracker["items"][0]
+        first_child = titem["children"][0]
+        first_child["attributes"]["type"] = [  # type: ignore[index]
+            ["Unsupported"]
+        ]
+
+        tchange = self.tracker_change(clean_model, tracker, gather_logs=True)
+
+        assert tchange.errors == [
+            "Invalid workitem 'REQ-002'. "
+            "Invalid field found: values [['Unsupported']] for 'type'"
+        ]
+
+    def test_nested_blacklisted_attribute_values_are_skipped(
+        self, clean_model: capellambse.MelodyModel
+    ) -> None:
+        """Test nested blacklisted attribute values are skipped."""
+        tracker = copy.deepcopy(self.tracker)
+        titem = tracker["items"][0]
+        first_child = titem["children"][0]
+        first_child["attributes"]["Type"] = [["Folder"]]  # type: ignore[index]
+
+        tchange = self.tracker_change(clean_model, tracker, gather_logs=True)
+
+        assert not tchange.errors
+
     def test_InvalidFieldValue_errors_are_gathered(
         self, clean_model: capellambse.MelodyModel
     ) -> None:
@@ -409,6 +452,24 @@ class TestModActions(ActionsTest):
 
         assert caplog.messages[0].endswith(message_end)
 
+    def test_unhashable_enum_values_are_gathered(
+        self, migration_model: capellambse.MelodyModel
+    ) -> None:
+        """Test unhashable enum values are gathered as faulty field data."""
+        tracker = copy.deepcopy(self.tracker)
+        titem = tracker["items"][0]
+        first_child = titem["children"][0]
+        first_child["attributes"]["type"] = [["Unsupported"]]
+
+        tchange = self.tracker_change(
+            migration_model, tracker, gather_logs=True
+        )
+
+        assert tchange.errors == [
+            "Invalid workitem 'REQ-002'. "
+            "Invalid field found: values [['Unsupported']] for 'type'"
+        ]
+
     def test_faulty_data_types_log_InvalidAttributeDefinition_as_error(
         self,
         migration_model: capellambse.MelodyModel,
@@ -444,6 +505,133 @@ class TestModActions(ActionsTest):
         assert "imagination" in caplog.messages[0]
         assert "Folder" in caplog.messages[0]
 
+    def test_moving_requirement_to_module_keeps_other_deletions(
+        self, migration_model: capellambse.MelodyModel
+    ) -> None:
+        folder = migration_model.by_uuid(
+            "b2c39449-ebbe-43cb-a712-22c740707a8b"
+        )
+        extra = folder.requirements.create(
+            identifier="REQ-005", long_name="Extra"
+        )
+        tracker = copy.deepcopy(self.tracker)
+        tracker["items"].append(tracker["items"][0]["children"].pop(0))
+
+        tchange = self.tracker_change(migration_model, tracker)
+
+        folder_action = next(
+            action
+            for action in tchange.actions
+            if action["parent"].uuid == folder.uuid
+        )
+        assert not tchange.errors
+        assert folder_action["delete"] == {
+            "requirements": [decl.UUIDReference(extra.uuid)]
+        }
+
+    def test_moving_all_requirements_to_module_drops_empty_actions(
+        self, migration_model: capellambse.MelodyModel
+    ) -> None:
+        folder = migration_model.by_uuid(
+            "b2c39449-ebbe-43cb-a712-22c740707a8b"
+        )
+        folder.requirements.create(
+            identifier="REQ-005", long_name="Extra", type=folder.type
+        )
+        tracker = copy.deepcopy(self.tracker)
+        tracker["items"].append(tracker["items"][0]["children"].pop(0))
+        tracker["items"].append(
+            {
+                "id": "REQ-005",
+                "long_name": "Extra",
+                "type": folder.type.identifier,
+            }
+        )
+
+        tchange = self.tracker_change(migration_model, tracker)
+
+        assert not tchange.errors
+        assert all(set(action) != {"parent"} for action in tchange.actions)
+
+    def test_unknown_workitem_types_are_gathered(
+        self, migration_model: capellambse.MelodyModel
+    ) -> None:
+        """Test unknown types of existing work items are gathered."""
+        tracker = copy.deepcopy(self.tracker)
+        titem = tracker["items"][0]
+        titem["children"][0]["type"] = "unknown"
+
+        tchange = self.tracker_change(
+            migration_model, tracker, gather_logs=True
+        )
+
+        assert tchange.errors == [
+            "Invalid workitem 'REQ-002'. Faulty workitem in snapshot: "
+            "Unknown workitem-type 'unknown'"
+        ]
+
+    def test_non_string_workitem_types_are_gathered(
+        self, migration_model: capellambse.MelodyModel
+    ) -> None:
+        """Test work item types that aren't strings are gathered."""
+        tracker = copy.deepcopy(self.tracker)
+        titem = tracker["items"][0]
+        titem["children"][0]["type"] = 1
+
+        tchange = self.tracker_change(
+            migration_model, tracker, gather_logs=True
+        )
+
+        assert tchange.errors == [
+            "Invalid workitem 'REQ-002'. Faulty workitem in snapshot: "
+            "Unknown workitem-type 1"
+        ]
+
+    def test_unknown_workitem_type_keeps_module_item(
+        self, migration_model: capellambse.MelodyModel
+    ) -> None:
+        """Test work items with unknown types under the module are kept."""
+        tracker = copy.deepcopy(self.tracker)
+        titem = tracker["items"][0]
+        titem["type"] = "unknown"
+        folder = migration_model.search("Folder").by_identifier(
+            titem["id"], single=True
+        )
+
+        tchange = self.tracker_change(
+            migration_model, tracker, gather_logs=True
+        )
+        deleted = {
+            ref.uuid
+            for action in tchange.actions
+            for refs in action.get("delete", {}).values()
+            for ref in refs
+        }
+
+        assert tchange.errors == [
+            f"Invalid workitem '{titem['id']}'. Faulty workitem in snapshot: "
+            "Unknown workitem-type 'unknown'"
+        ]
+        assert folder.uuid not in deleted
+
+    def test_faulty_requirement_type_attributes_are_gathered(
+        self, migration_model: capellambse.MelodyModel
+    ) -> None:
+        """Test faulty simple attributes on RequirementTypes are gathered."""
+        tracker = copy.deepcopy(self.tracker)
+        reqtype = tracker["requirement_types"]["system_requirement"]
+        reqtype["imagination"] = 1  # type: ignore[typeddict-unknown-key]
+
+        tchange = self.tracker_change(
+            migration_model, tracker, gather_logs=True
+        )
+
+        assert len(tchange.errors) == 1
+        assert tchange.errors[0].startswith(
+            "Invalid workitem 'system_requirement'."
+        )
+        assert "imagination" in tchange.errors[0]
+
     def test_InvalidAttributeDefinition_errors_are_gathered(
         self, migration_model: capellambse.MelodyModel
     ) -> None: